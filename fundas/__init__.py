@@ -9,6 +9,7 @@ Main functions:
     - read_image: Extract structured data from images
     - read_audio: Extract structured data from audio files
     - read_webpage: Extract structured data from web pages
+    - read_webpages: Extract structured data from several web pages concurrently
     - read_video: Extract structured data from videos
     - to_summarized_csv: Export DataFrame to CSV with AI summarization
     - to_summarized_excel: Export DataFrame to Excel with AI summarization
@@ -28,6 +29,7 @@ from .readers import (
     read_image,
     read_audio,
     read_webpage,
+    read_webpages,
     read_video,
 )
 
@@ -47,6 +49,7 @@ __all__ = [
     "read_image",
     "read_audio",
     "read_webpage",
+    "read_webpages",
     "read_video",
     "to_summarized_csv",
     "to_summarized_excel",
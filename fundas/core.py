@@ -9,10 +9,12 @@ import os
 import time
 import json
 import requests
+from itertools import repeat
 from typing import Dict, Any, Optional, List, TYPE_CHECKING
 from dotenv import load_dotenv
 
 from .cache import get_cache
+from .http import get_shared_session
 
 if TYPE_CHECKING:
     from .schema import Schema
@@ -21,6 +23,76 @@ if TYPE_CHECKING:
 load_dotenv()
 
 
+def _strip_code_fence(text: str) -> str:
+    """
+    Return the JSON payload of a model response.
+
+    Models often wrap JSON in a markdown code block (```json ... ``` or
+    ``` ... ```). The contents of the first block are returned; text with
+    no code block is returned stripped.
+    """
+    if "```json" in text:
+        start = text.find("```json") + 7
+    elif "```" in text:
+        start = text.find("```") + 3
+    else:
+        return text.strip()
+    end = text.find("```", start)
+    return text[start:end].strip()
+
+
+def _normalize_data(
+    data: Dict[str, Any], broadcast_scalars: bool = True
+) -> Dict[str, Any]:
+    """
+    Ensure all values in extracted data are lists of the same length.
+
+    Shorter lists are padded with None in place, so the parsed response is
+    reused rather than copied.
+
+    Args:
+        data: Parsed JSON object mapping column names to values
+        broadcast_scalars: If True, non-list values are repeated to fill the
+            column. Otherwise they become the first row, padded with None.
+
+    Returns:
+        The normalized data
+    """
+    # Find the maximum length among all arrays, noting whether the data is
+    # already uniform (the common case for well-formed responses)
+    max_len = 0
+    first_len = None
+    uniform = True
+    for value in data.values():
+        if isinstance(value, list):
+            length = len(value)
+        else:
+            length = 1
+            uniform = False
+        if first_len is None:
+            first_len = length
+        elif length != first_len:
+            uniform = False
+        if length > max_len:
+            max_len = length
+
+    if uniform:
+        return data
+
+    for key, value in data.items():
+        if isinstance(value, list):
+            if len(value) < max_len:
+                value.extend(repeat(None, max_len - len(value)))
+        elif broadcast_scalars:
+            data[key] = [value] * max_len
+        else:
+            column = [value]
+            column.extend(repeat(None, max_len - 1))
+            data[key] = column
+
+    return data
+
+
 class OpenRouterClient:
     """Client for interacting with OpenRouter API."""
 
@@ -62,6 +134,7 @@ class OpenRouterClient:
         self.cache = get_cache(ttl=cache_ttl) if use_cache else None
         self.max_retries = max_retries
         self.retry_delay = retry_delay
+        self.session = get_shared_session()
 
     def process_content(
         self,
@@ -114,7 +187,7 @@ class OpenRouterClient:
         last_exception = None
         for attempt in range(self.max_retries):
             try:
-                response = requests.post(
+                response = self.session.post(
                     self.base_url, headers=headers, json=payload, timeout=60
                 )
                 response.raise_for_status()
@@ -188,7 +261,7 @@ class OpenRouterClient:
         last_exception = None
         for attempt in range(self.max_retries):
             try:
-                response = requests.post(
+                response = self.session.post(
                     self.base_url, headers=headers, json=payload, timeout=60
                 )
                 response.raise_for_status()
@@ -270,41 +343,13 @@ class OpenRouterClient:
             try:
                 # Look for JSON in the response
                 # (it might be wrapped in markdown code blocks)
-                if "```json" in response_text:
-                    json_start = response_text.find("```json") + 7
-                    json_end = response_text.find("```", json_start)
-                    json_str = response_text[json_start:json_end].strip()
-                elif "```" in response_text:
-                    json_start = response_text.find("```") + 3
-                    json_end = response_text.find("```", json_start)
-                    json_str = response_text[json_start:json_end].strip()
-                else:
-                    json_str = response_text.strip()
+                json_str = _strip_code_fence(response_text)
 
                 data = json.loads(json_str)
 
                 # Normalize data: ensure all arrays have the same length
                 if isinstance(data, dict):
-                    # Find the maximum length
-                    max_len = max(
-                        (len(v) if isinstance(v, list) else 1 for v in data.values()),
-                        default=1,
-                    )
-                    # Pad shorter arrays with None or repeat last value
-                    normalized_data = {}
-                    for key, value in data.items():
-                        if isinstance(value, list):
-                            if len(value) < max_len:
-                                # Pad with None
-                                normalized_data[key] = value + [None] * (
-                                    max_len - len(value)
-                                )
-                            else:
-                                normalized_data[key] = value
-                        else:
-                            # Convert single values to list
-                            normalized_data[key] = [value] * max_len
-                    data = normalized_data
+                    data = _normalize_data(data)
 
                 # Cache the result
                 if self.use_cache and self.cache:
@@ -426,37 +471,13 @@ class OpenRouterClient:
             # Try to parse JSON from the response
             try:
                 # Look for JSON in the response
-                if "```json" in response_text:
-                    json_start = response_text.find("```json") + 7
-                    json_end = response_text.find("```", json_start)
-                    json_str = response_text[json_start:json_end].strip()
-                elif "```" in response_text:
-                    json_start = response_text.find("```") + 3
-                    json_end = response_text.find("```", json_start)
-                    json_str = response_text[json_start:json_end].strip()
-                else:
-                    json_str = response_text.strip()
+                json_str = _strip_code_fence(response_text)
 
                 data = json.loads(json_str)
 
                 # Normalize data: ensure all arrays have the same length
                 if isinstance(data, dict):
-                    max_len = max(
-                        (len(v) if isinstance(v, list) else 1 for v in data.values()),
-                        default=1,
-                    )
-                    normalized_data = {}
-                    for key, value in data.items():
-                        if isinstance(value, list):
-                            if len(value) < max_len:
-                                normalized_data[key] = value + [None] * (
-                                    max_len - len(value)
-                                )
-                            else:
-                                normalized_data[key] = value
-                        else:
-                            normalized_data[key] = [value] * max_len
-                    data = normalized_data
+                    data = _normalize_data(data)
 
                 # Cache the raw result (before type conversion)
                 if self.use_cache and self.cache:
@@ -535,35 +556,13 @@ class OpenRouterClient:
             try:
                 # Look for JSON in the response
                 # (it might be wrapped in markdown code blocks)
-                if "```json" in response_text:
-                    json_start = response_text.find("```json") + 7
-                    json_end = response_text.find("```", json_start)
-                    json_str = response_text[json_start:json_end].strip()
-                elif "```" in response_text:
-                    json_start = response_text.find("```") + 3
-                    json_end = response_text.find("```", json_start)
-                    json_str = response_text[json_start:json_end].strip()
-                else:
-                    json_str = response_text.strip()
+                json_str = _strip_code_fence(response_text)
 
                 data = json.loads(json_str)
 
                 # Normalize data to ensure all arrays have the same length
                 if isinstance(data, dict):
-                    # Find the maximum length among all arrays
-                    max_length = max(
-                        (len(v) if isinstance(v, list) else 1 for v in data.values()),
-                        default=1,
-                    )
-
-                    # Pad shorter arrays with None
-                    for key, value in data.items():
-                        if isinstance(value, list):
-                            if len(value) < max_length:
-                                data[key] = value + [None] * (max_length - len(value))
-                        else:
-                            # If value is not a list, convert it to a list
-                            data[key] = [value] + [None] * (max_length - 1)
+                    data = _normalize_data(data, broadcast_scalars=False)
 
                 # Cache the result
                 if self.use_cache and self.cache:
@@ -5,6 +5,8 @@ This module provides functions to export DataFrames to various formats
 with AI-powered transformation and summarization.
 """
 
+import functools
+import os
 import pandas as pd
 from typing import Optional, Union
 from pathlib import Path
@@ -12,12 +14,24 @@ from pathlib import Path
 from .core import OpenRouterClient
 
 
+@functools.lru_cache(maxsize=32)
+def _cached_client(api_key: Optional[str], model: str) -> OpenRouterClient:
+    """Build one OpenRouter client per (api_key, model) pair."""
+    return OpenRouterClient(api_key=api_key, model=model)
+
+
 def _get_client(
     api_key: Optional[str] = None, model: Optional[str] = None
 ) -> OpenRouterClient:
-    """Get or create an OpenRouter client instance."""
-    default_model = model or "openai/gpt-3.5-turbo"
-    return OpenRouterClient(api_key=api_key, model=default_model)
+    """
+    Get or create an OpenRouter client instance.
+
+    The API key is resolved from the environment before the cache lookup,
+    so changing OPENROUTER_API_KEY yields a new client rather than a stale
+    one.
+    """
+    resolved_key = api_key or os.environ.get("OPENROUTER_API_KEY")
+    return _cached_client(resolved_key, model or "openai/gpt-3.5-turbo")
 
 
 def to_summarized_csv(
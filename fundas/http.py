@@ -0,0 +1,43 @@
+"""
+Shared HTTP session for Fundas.
+
+This module provides a process-wide requests session so that API calls
+reuse pooled keep-alive connections, DNS lookups and TLS sessions instead
+of opening a new connection for every request.
+"""
+
+import atexit
+import threading
+from typing import Optional
+
+import requests
+from requests.adapters import HTTPAdapter
+
+# Global session instance
+_shared_session: Optional[requests.Session] = None
+_session_lock = threading.Lock()
+
+
+def get_shared_session() -> requests.Session:
+    """
+    Get or create the shared requests session.
+
+    The session is created on first use with a connection pool sized for
+    concurrent reads, and closed automatically at interpreter exit.
+
+    Returns:
+        The global requests.Session instance
+    """
+    global _shared_session
+
+    if _shared_session is None:
+        with _session_lock:
+            if _shared_session is None:
+                session = requests.Session()
+                adapter = HTTPAdapter(pool_connections=32, pool_maxsize=128)
+                session.mount("http://", adapter)
+                session.mount("https://", adapter)
+                atexit.register(session.close)
+                _shared_session = session
+
+    return _shared_session
@@ -0,0 +1,57 @@
+"""
+Retry helpers for Fundas.
+
+This module provides a decorator that retries transient failures with
+a linearly increasing delay between attempts.
+"""
+
+import functools
+import time
+from typing import Callable, Tuple, Type
+
+
+def with_retry(
+    max_retries: int,
+    retry_delay: float,
+    exceptions: Tuple[Type[BaseException], ...] = (Exception,),
+    no_retry: Tuple[Type[BaseException], ...] = (),
+) -> Callable:
+    """
+    Decorator that retries a function when it raises.
+
+    Args:
+        max_retries: Total number of attempts. At least one attempt is
+            always made.
+        retry_delay: Base delay in seconds. The wait after attempt n
+            is retry_delay * n.
+        exceptions: Exception types that trigger a retry
+        no_retry: Exception types that are re-raised immediately, even
+            if they subclass one of exceptions
+
+    Returns:
+        Decorator applying the retry policy
+
+    Examples:
+        >>> @with_retry(max_retries=3, retry_delay=1.0)
+        ... def fetch():
+        ...     return requests.get("https://example.com")
+    """
+
+    def decorator(func: Callable) -> Callable:
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            attempts = max(1, max_retries)
+            for attempt in range(attempts):
+                try:
+                    return func(*args, **kwargs)
+                except no_retry:
+                    raise
+                except exceptions:
+                    if attempt == attempts - 1:
+                        raise
+                # Wait before retry (linear backoff)
+                time.sleep(retry_delay * (attempt + 1))
+
+        return wrapper
+
+    return decorator
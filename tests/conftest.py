@@ -0,0 +1,151 @@
+"""
+Shared pytest fixtures for the Fundas test suite.
+"""
+
+import sys
+from unittest.mock import Mock, NonCallableMock
+
+import pytest
+import requests
+
+from fundas.core import OpenRouterClient
+
+# Cached responses expire after 12 hours
+REQUESTS_CACHE_EXPIRE_AFTER = 12 * 60 * 60
+
+
+def pytest_addoption(parser):
+    """Register Fundas-specific command line options."""
+    parser.addoption(
+        "--use-requests-cache",
+        action="store_true",
+        default=False,
+        help="Cache live HTTP responses in .cache/requests-cache.sqlite "
+        "(requires requests-cache)",
+    )
+
+
+def pytest_configure(config):
+    """Install the opt-in HTTP response cache before any test runs."""
+    if not config.getoption("--use-requests-cache"):
+        return
+
+    try:
+        import requests_cache
+    except ImportError:
+        raise pytest.UsageError(
+            "--use-requests-cache requires requests-cache. "
+            "Install with: pip install requests-cache"
+        )
+
+    requests_cache.install_cache(
+        ".cache/requests-cache", expire_after=REQUESTS_CACHE_EXPIRE_AFTER
+    )
+    config.add_cleanup(requests_cache.uninstall_cache)
+
+
+@pytest.fixture(scope="session")
+def dummy_files(tmp_path_factory):
+    """Empty files shared by the whole session, keyed by suffix."""
+    directory = tmp_path_factory.mktemp("files")
+    paths = {}
+    for suffix in (".pdf", ".png", ".mp4", ".mp3", ".wav"):
+        path = directory / f"dummy{suffix}"
+        path.touch()
+        paths[suffix] = str(path)
+    return paths
+
+
+@pytest.fixture(scope="session")
+def dummy_pdf(dummy_files):
+    """Path to an empty .pdf file shared by the whole session."""
+    return dummy_files[".pdf"]
+
+
+@pytest.fixture(scope="session")
+def dummy_png(dummy_files):
+    """Path to an empty .png file shared by the whole session."""
+    return dummy_files[".png"]
+
+
+@pytest.fixture(scope="session")
+def dummy_mp4(dummy_files):
+    """Path to an empty .mp4 file shared by the whole session."""
+    return dummy_files[".mp4"]
+
+
+@pytest.fixture(scope="session")
+def dummy_mp3(dummy_files):
+    """Path to an empty .mp3 file shared by the whole session."""
+    return dummy_files[".mp3"]
+
+
+@pytest.fixture(scope="session")
+def dummy_wav(dummy_files):
+    """Path to an empty .wav file shared by the whole session."""
+    return dummy_files[".wav"]
+
+
+@pytest.fixture
+def fake_pytesseract(monkeypatch):
+    """Install a Mock as the pytesseract module for the duration of a test."""
+    module = Mock()
+    monkeypatch.setitem(sys.modules, "pytesseract", module)
+    return module
+
+
+@pytest.fixture
+def make_mock_client():
+    """
+    Factory for OpenRouterClient mocks with preset extraction results.
+
+    The mocks are spec'd on OpenRouterClient, so calling a method the
+    client does not have fails instead of silently returning a Mock.
+    """
+
+    def factory(data=None, image_data=None):
+        client = NonCallableMock(spec_set=OpenRouterClient)
+        client.extract_structured_data.return_value = data
+        client.extract_structured_data_from_image.return_value = image_data
+        return client
+
+    return factory
+
+
+@pytest.fixture(scope="module")
+def or_client():
+    """OpenRouterClient shared by a test module, with caching disabled."""
+    return OpenRouterClient(api_key="test-key", use_cache=False)
+
+
+@pytest.fixture
+def mock_post(monkeypatch):
+    """Replace requests.Session.post, which OpenRouterClient sends through."""
+    post = Mock()
+    monkeypatch.setattr(requests.Session, "post", post)
+    return post
+
+
+class FakeResponse:
+    """Successful HTTP response carrying a fixed JSON payload."""
+
+    __slots__ = ("payload",)
+
+    def __init__(self, payload):
+        self.payload = payload
+
+    def json(self):
+        return self.payload
+
+    def raise_for_status(self):
+        return None
+
+
+@pytest.fixture
+def make_api_response():
+    """Factory for OpenRouter chat-completion responses with given content."""
+
+    def factory(content: str):
+        return FakeResponse({"choices": [{"message": {"content": content}}]})
+
+    return factory
@@ -2,149 +2,146 @@
 Tests for fundas.cache module.
 """
 
-import time
-from pathlib import Path
-from unittest.mock import Mock, patch
-import tempfile
-import shutil
+import pytest
 
 from fundas.cache import APICache, get_cache
+from fundas.core import OpenRouterClient
 
 
-class TestAPICache:
-    """Tests for APICache class."""
+@pytest.fixture
+def clock(monkeypatch):
+    """Replace the cache's clock with a list-backed virtual clock."""
+    now = [1000.0]
+    monkeypatch.setattr("fundas.cache.time.time", lambda: now[0])
+    return now
+
 
-    def setup_method(self):
-        """Set up test fixtures."""
-        self.temp_dir = tempfile.mkdtemp()
-        self.cache = APICache(
-            cache_dir=self.temp_dir, ttl=1
-        )  # 1 second TTL for testing
+@pytest.fixture
+def cache(tmp_path):
+    """APICache in a per-test directory with a 1 second TTL."""
+    return APICache(cache_dir=str(tmp_path), ttl=1)
 
-    def teardown_method(self):
-        """Clean up test fixtures."""
-        if Path(self.temp_dir).exists():
-            shutil.rmtree(self.temp_dir)
 
-    def test_cache_initialization(self):
+class TestAPICache:
+    """Tests for APICache class."""
+
+    def test_cache_initialization(self, cache, tmp_path):
         """Test cache initialization."""
-        assert self.cache.cache_dir == Path(self.temp_dir)
-        assert self.cache.ttl == 1
-        assert self.cache.enabled is True
-        assert self.cache.cache_dir.exists()
+        assert cache.cache_dir == tmp_path
+        assert cache.ttl == 1
+        assert cache.enabled is True
+        assert cache.cache_dir.exists()
 
-    def test_cache_set_and_get(self):
+    def test_cache_set_and_get(self, cache):
         """Test setting and getting cache entries."""
         data = {"name": ["John"], "age": ["30"]}
-        self.cache.set("content", "prompt", "model", data)
+        cache.set("content", "prompt", "model", data)
 
-        result = self.cache.get("content", "prompt", "model")
+        result = cache.get("content", "prompt", "model")
         assert result == data
 
-    def test_cache_get_nonexistent(self):
+    def test_cache_get_nonexistent(self, cache):
         """Test getting non-existent cache entry."""
-        result = self.cache.get("nonexistent", "prompt", "model")
+        result = cache.get("nonexistent", "prompt", "model")
         assert result is None
 
-    def test_cache_expiration(self):
+    def test_cache_expiration(self, cache, clock):
         """Test cache entry expiration."""
         data = {"name": ["John"]}
-        self.cache.set("content", "prompt", "model", data)
+        cache.set("content", "prompt", "model", data)
 
         # Entry should exist
-        result = self.cache.get("content", "prompt", "model")
+        result = cache.get("content", "prompt", "model")
         assert result == data
 
-        # Wait for expiration
-        time.sleep(1.1)
+        # Advance past the TTL
+        clock[0] += 1.1
 
         # Entry should be expired
-        result = self.cache.get("content", "prompt", "model")
+        result = cache.get("content", "prompt", "model")
         assert result is None
 
-    def test_cache_with_columns(self):
+    def test_cache_with_columns(self, cache):
         """Test cache with column specification."""
         data = {"name": ["John"], "age": ["30"]}
-        self.cache.set("content", "prompt", "model", data, columns=["name", "age"])
+        cache.set("content", "prompt", "model", data, columns=["name", "age"])
 
-        result = self.cache.get("content", "prompt", "model", columns=["name", "age"])
+        result = cache.get("content", "prompt", "model", columns=["name", "age"])
         assert result == data
 
         # Different columns should not match
-        result = self.cache.get("content", "prompt", "model", columns=["name"])
+        result = cache.get("content", "prompt", "model", columns=["name"])
         assert result is None
 
-    def test_cache_different_prompts(self):
+    def test_cache_different_prompts(self, cache):
         """Test that different prompts create different cache entries."""
         data1 = {"result": ["A"]}
         data2 = {"result": ["B"]}
 
-        self.cache.set("content", "prompt1", "model", data1)
-        self.cache.set("content", "prompt2", "model", data2)
+        cache.set("content", "prompt1", "model", data1)
+        cache.set("content", "prompt2", "model", data2)
 
-        assert self.cache.get("content", "prompt1", "model") == data1
-        assert self.cache.get("content", "prompt2", "model") == data2
+        assert cache.get("content", "prompt1", "model") == data1
+        assert cache.get("content", "prompt2", "model") == data2
 
-    def test_cache_clear(self):
+    def test_cache_clear(self, cache):
         """Test clearing all cache entries."""
-        self.cache.set("content1", "prompt", "model", {"data": ["A"]})
-        self.cache.set("content2", "prompt", "model", {"data": ["B"]})
+        cache.set("content1", "prompt", "model", {"data": ["A"]})
+        cache.set("content2", "prompt", "model", {"data": ["B"]})
 
-        count = self.cache.clear()
+        count = cache.clear()
         assert count == 2
 
-        assert self.cache.get("content1", "prompt", "model") is None
-        assert self.cache.get("content2", "prompt", "model") is None
+        assert cache.get("content1", "prompt", "model") is None
+        assert cache.get("content2", "prompt", "model") is None
 
-    def test_cache_clear_expired(self):
+    def test_cache_clear_expired(self, cache, clock):
         """Test clearing only expired cache entries."""
-        # Add entry that will expire
-        self.cache.set("content1", "prompt", "model", {"data": ["A"]})
-
-        # Wait for expiration
-        time.sleep(1.1)
-
-        # Add fresh entry
-        self.cache.set("content2", "prompt", "model", {"data": ["B"]})
-
-        count = self.cache.clear_expired()
+        # Write both entries at explicit virtual timestamps, 2s apart
+        clock[0] = 1000.0
+        cache.set("content1", "prompt", "model", {"data": ["A"]})
+        clock[0] = 1002.0
+        cache.set("content2", "prompt", "model", {"data": ["B"]})
+
+        # Only content1 is older than the 1 second TTL
+        count = cache.clear_expired()
         assert count == 1
 
         # Expired entry should be gone
-        assert self.cache.get("content1", "prompt", "model") is None
+        assert cache.get("content1", "prompt", "model") is None
 
         # Fresh entry should still exist
-        assert self.cache.get("content2", "prompt", "model") == {"data": ["B"]}
+        assert cache.get("content2", "prompt", "model") == {"data": ["B"]}
 
-    def test_cache_disable_enable(self):
+    def test_cache_disable_enable(self, cache):
         """Test disabling and enabling cache."""
         data = {"name": ["John"]}
 
         # Cache is enabled by default
-        self.cache.set("content", "prompt", "model", data)
-        assert self.cache.get("content", "prompt", "model") == data
+        cache.set("content", "prompt", "model", data)
+        assert cache.get("content", "prompt", "model") == data
 
         # Disable cache
-        self.cache.disable()
-        assert self.cache.enabled is False
+        cache.disable()
+        assert cache.enabled is False
 
         # Should not get cached data when disabled
-        assert self.cache.get("content", "prompt", "model") is None
+        assert cache.get("content", "prompt", "model") is None
 
         # Should not set data when disabled
-        self.cache.set("content2", "prompt", "model", data)
-        self.cache.enable()
-        assert self.cache.get("content2", "prompt", "model") is None
+        cache.set("content2", "prompt", "model", data)
+        cache.enable()
+        assert cache.get("content2", "prompt", "model") is None
 
-    def test_cache_corrupted_file(self):
+    def test_cache_corrupted_file(self, cache):
         """Test handling of corrupted cache files."""
         # Create a corrupted cache file
-        cache_file = self.cache.cache_dir / "corrupted.json"
+        cache_file = cache.cache_dir / "corrupted.json"
         with open(cache_file, "w") as f:
             f.write("not valid json {{{")
 
         # Should not crash and return None
-        result = self.cache.get("content", "prompt", "model")
+        result = cache.get("content", "prompt", "model")
         assert result is None
 
     def test_get_cache_singleton(self):
@@ -157,70 +154,20 @@ class TestAPICache:
 class TestCacheIntegration:
     """Integration tests for caching with OpenRouterClient."""
 
-    def setup_method(self):
-        """Set up test fixtures."""
-        self.temp_dir = tempfile.mkdtemp()
-
-    def teardown_method(self):
-        """Clean up test fixtures."""
-        if Path(self.temp_dir).exists():
-            shutil.rmtree(self.temp_dir)
-
-    @patch("fundas.cache.get_cache")
-    @patch("fundas.core.requests.post")
-    def test_client_uses_cache(self, mock_post, mock_get_cache):
-        """Test that OpenRouterClient uses cache."""
-        from fundas.core import OpenRouterClient
-
-        # Set up mock cache
-        mock_cache = Mock()
-        # First get() returns None (cache miss),
-        # second get() returns cached data (cache hit)
-        mock_cache.get.side_effect = [None, {"name": ["John"]}]
-        mock_cache.set = Mock()
-        mock_get_cache.return_value = mock_cache
-
-        mock_response = Mock()
-        mock_response.json.return_value = {
-            "choices": [{"message": {"content": '{"name": ["John"]}'}}]
-        }
-        mock_response.raise_for_status = Mock()
-        mock_post.return_value = mock_response
-
-        # Create client with cache - this will call get_cache()
-        client = OpenRouterClient(api_key="test-key", use_cache=True, cache_ttl=10)
-        # Manually set the cache to our mock
-        client.cache = mock_cache
-
-        # First call should hit the API
-        result1 = client.extract_structured_data("test content", "extract data")
-        assert mock_post.call_count == 1
-        assert mock_cache.set.call_count == 1
-
-        # Second call with same parameters should use cache
-        result2 = client.extract_structured_data("test content", "extract data")
-        assert mock_post.call_count == 1  # No additional API call
-
-        assert result1 == result2
+    @pytest.mark.parametrize("use_cache, expected_posts", [(True, 1), (False, 2)])
+    def test_client_repeated_call(
+        self, mock_post, use_cache, expected_posts, tmp_path, make_api_response
+    ):
+        """Test that a repeated call only hits the API again without cache."""
+        mock_post.return_value = make_api_response('{"name": ["John"]}')
 
-    @patch("fundas.core.requests.post")
-    def test_client_without_cache(self, mock_post):
-        """Test that OpenRouterClient can work without cache."""
-        from fundas.core import OpenRouterClient
+        client = OpenRouterClient(api_key="test-key", use_cache=use_cache, cache_ttl=10)
+        if use_cache:
+            # Real cache in tmp_path rather than the shared on-disk one
+            client.cache = APICache(cache_dir=str(tmp_path), ttl=60)
 
-        mock_response = Mock()
-        mock_response.json.return_value = {
-            "choices": [{"message": {"content": '{"name": ["John"]}'}}]
-        }
-        mock_response.raise_for_status = Mock()
-        mock_post.return_value = mock_response
-
-        # Create client without cache
-        client = OpenRouterClient(api_key="test-key", use_cache=False)
-
-        # Each call should hit the API
-        client.extract_structured_data("test content", "extract data")
-        assert mock_post.call_count == 1
+        result1 = client.extract_structured_data("test content", "extract data")
+        result2 = client.extract_structured_data("test content", "extract data")
 
-        client.extract_structured_data("test content", "extract data")
-        assert mock_post.call_count == 2  # Second API call made
+        assert mock_post.call_count == expected_posts
+        assert result1 == result2 == {"name": ["John"]}
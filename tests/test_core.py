@@ -3,8 +3,17 @@ Tests for fundas.core module.
 """
 
 import pytest
-from unittest.mock import Mock, patch
-from fundas.core import OpenRouterClient
+from requests.exceptions import RequestException
+from unittest.mock import patch
+from fundas.core import (
+    OpenRouterClient,
+    _normalize_data,
+    _strip_code_fence,
+)
+
+# Every test in this module gets requests.Session.post replaced, so none
+# of them can reach the OpenRouter API by accident
+pytestmark = pytest.mark.usefixtures("mock_post")
 
 
 class TestOpenRouterClient:
@@ -34,34 +43,22 @@ class TestOpenRouterClient:
             client = OpenRouterClient()
             assert client.api_key == "env-key"
 
-    @patch("fundas.core.requests.post")
-    def test_process_content_success(self, mock_post):
+    def test_process_content_success(self, or_client, mock_post, make_api_response):
         """Test successful content processing."""
-        mock_response = Mock()
-        mock_response.json.return_value = {
-            "choices": [{"message": {"content": "Test response"}}]
-        }
-        mock_response.raise_for_status = Mock()
-        mock_post.return_value = mock_response
+        mock_post.return_value = make_api_response("Test response")
 
-        client = OpenRouterClient(api_key="test-key")
-        result = client.process_content("test content", "test prompt")
+        result = or_client.process_content("test content", "test prompt")
 
         assert result["choices"][0]["message"]["content"] == "Test response"
         mock_post.assert_called_once()
 
-    @patch("fundas.core.requests.post")
-    def test_process_content_with_system_prompt(self, mock_post):
+    def test_process_content_with_system_prompt(
+        self, or_client, mock_post, make_api_response
+    ):
         """Test content processing with system prompt."""
-        mock_response = Mock()
-        mock_response.json.return_value = {
-            "choices": [{"message": {"content": "Test response"}}]
-        }
-        mock_response.raise_for_status = Mock()
-        mock_post.return_value = mock_response
+        mock_post.return_value = make_api_response("Test response")
 
-        client = OpenRouterClient(api_key="test-key")
-        result = client.process_content(
+        result = or_client.process_content(
             "test content", "test prompt", system_prompt="test system prompt"
         )
 
@@ -74,67 +71,58 @@ class TestOpenRouterClient:
         assert messages[0]["role"] == "system"
         assert messages[1]["role"] == "user"
 
-    @patch("fundas.core.requests.post")
-    def test_process_content_api_error(self, mock_post):
+    def test_process_content_api_error(self, or_client, mock_post):
         """Test handling of API errors."""
-        import requests
+        mock_post.side_effect = RequestException("API Error")
 
-        mock_post.side_effect = requests.exceptions.RequestException("API Error")
-
-        client = OpenRouterClient(api_key="test-key")
         with pytest.raises(
             RuntimeError, match="Error communicating with OpenRouter API"
         ):
-            client.process_content("test content", "test prompt")
-
-    @patch("fundas.core.requests.post")
-    def test_extract_structured_data_json_response(self, mock_post):
-        """Test extracting structured data with JSON response."""
-        mock_response = Mock()
-        mock_response.json.return_value = {
-            "choices": [{"message": {"content": '{"name": ["John"], "age": ["30"]}'}}]
-        }
-        mock_response.raise_for_status = Mock()
-        mock_post.return_value = mock_response
-
-        client = OpenRouterClient(api_key="test-key")
-        result = client.extract_structured_data("test content", "extract data")
-
-        assert result == {"name": ["John"], "age": ["30"]}
-
-    @patch("fundas.core.requests.post")
-    def test_extract_structured_data_markdown_json(self, mock_post):
-        """Test extracting structured data from markdown-wrapped JSON."""
-        mock_response = Mock()
-        mock_response.json.return_value = {
-            "choices": [
-                {
-                    "message": {
-                        "content": '```json\n{"name": ["John"], "age": ["30"]}\n```'
-                    }
-                }
-            ]
-        }
-        mock_response.raise_for_status = Mock()
-        mock_post.return_value = mock_response
-
-        client = OpenRouterClient(api_key="test-key")
-        result = client.extract_structured_data("test content", "extract data")
-
-        assert result == {"name": ["John"], "age": ["30"]}
-
-    @patch("fundas.core.requests.post")
-    def test_extract_structured_data_with_columns(self, mock_post):
+            or_client.process_content("test content", "test prompt")
+
+    @pytest.mark.parametrize(
+        "content, expected",
+        [
+            pytest.param(
+                '{"name": ["John"], "age": ["30"]}',
+                {"name": ["John"], "age": ["30"]},
+                id="json",
+            ),
+            pytest.param(
+                '```json\n{"name": ["John"], "age": ["30"]}\n```',
+                {"name": ["John"], "age": ["30"]},
+                id="markdown-json",
+            ),
+            pytest.param(
+                '```\n{"name": ["John"]}\n```',
+                {"name": ["John"]},
+                id="markdown-plain",
+            ),
+            # Invalid JSON comes back as raw text in structured form
+            pytest.param(
+                "This is not valid JSON",
+                {"content": ["This is not valid JSON"]},
+                id="invalid-json",
+            ),
+        ],
+    )
+    def test_extract_structured_data(
+        self, or_client, mock_post, make_api_response, content, expected
+    ):
+        """Test extracting structured data from each response shape."""
+        mock_post.return_value = make_api_response(content)
+
+        result = or_client.extract_structured_data("test content", "extract data")
+
+        assert result == expected
+
+    def test_extract_structured_data_with_columns(
+        self, or_client, mock_post, make_api_response
+    ):
         """Test extracting structured data with specified columns."""
-        mock_response = Mock()
-        mock_response.json.return_value = {
-            "choices": [{"message": {"content": '{"name": ["John"], "age": ["30"]}'}}]
-        }
-        mock_response.raise_for_status = Mock()
-        mock_post.return_value = mock_response
-
-        client = OpenRouterClient(api_key="test-key", use_cache=False)
-        result = client.extract_structured_data(
+        mock_post.return_value = make_api_response('{"name": ["John"], "age": ["30"]}')
+
+        result = or_client.extract_structured_data(
             "test content", "extract data", columns=["name", "age"]
         )
 
@@ -149,19 +137,55 @@ class TestOpenRouterClient:
             assert "name" in system_msg
             assert "age" in system_msg
 
-    @patch("fundas.core.requests.post")
-    def test_extract_structured_data_invalid_json(self, mock_post):
-        """Test extracting structured data with invalid JSON response."""
-        mock_response = Mock()
-        mock_response.json.return_value = {
-            "choices": [{"message": {"content": "This is not valid JSON"}}]
-        }
-        mock_response.raise_for_status = Mock()
-        mock_post.return_value = mock_response
-
-        client = OpenRouterClient(api_key="test-key", use_cache=False)
-        result = client.extract_structured_data("test content", "extract data")
-
-        # Should return raw text in structured format
-        assert "content" in result
-        assert result["content"][0] == "This is not valid JSON"
+
+class TestNormalizeData:
+    """Tests for _normalize_data helper."""
+
+    def test_pads_shorter_lists_with_none(self):
+        """Test that shorter lists are padded in place."""
+        names = ["John", "Jane"]
+        data = {"name": names, "age": ["30"]}
+        result = _normalize_data(data)
+
+        assert result == {"name": ["John", "Jane"], "age": ["30", None]}
+        assert result["name"] is names
+
+    def test_broadcasts_scalars(self):
+        """Test that scalar values are repeated to the column length."""
+        result = _normalize_data({"name": ["John", "Jane"], "source": "web"})
+        assert result["source"] == ["web", "web"]
+
+    def test_pads_scalars_without_broadcast(self):
+        """Test that scalar values are padded with None when not broadcast."""
+        result = _normalize_data(
+            {"name": ["John", "Jane"], "source": "web"}, broadcast_scalars=False
+        )
+        assert result["source"] == ["web", None]
+
+    def test_uniform_data_returned_unchanged(self):
+        """Test that already-uniform data is returned as-is."""
+        data = {"name": ["John", "Jane"], "age": ["30", "25"]}
+        assert _normalize_data(data) is data
+        assert data == {"name": ["John", "Jane"], "age": ["30", "25"]}
+
+    def test_pads_empty_leading_list(self):
+        """Test that an empty list before a longer one is still padded."""
+        result = _normalize_data({"name": [], "age": ["30", "25"]})
+        assert result["name"] == [None, None]
+
+
+class TestStripCodeFence:
+    """Tests for _strip_code_fence helper."""
+
+    @pytest.mark.parametrize(
+        "text, expected",
+        [
+            ('  {"a": 1}\n', '{"a": 1}'),
+            ('```json\n{"a": 1}\n```', '{"a": 1}'),
+            ('Here you go:\n```\n{"a": 1}\n```\nDone.', '{"a": 1}'),
+        ],
+        ids=["bare", "json-fence", "plain-fence"],
+    )
+    def test_strip_code_fence(self, text, expected):
+        """Test that the payload is extracted from each wrapping style."""
+        assert _strip_code_fence(text) == expected
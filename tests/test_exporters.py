@@ -2,13 +2,13 @@
 Tests for fundas.exporters module.
 """
 
+import importlib.util
+import json
 import pytest
 import pandas as pd
-from pathlib import Path
-from unittest.mock import Mock, patch
-import tempfile
-import os
+from unittest.mock import NonCallableMock, patch
 
+from fundas.core import OpenRouterClient
 from fundas.exporters import (
     to_summarized_csv,
     to_summarized_excel,
@@ -17,13 +17,8 @@ from fundas.exporters import (
     _get_client,
 )
 
-# Check if openpyxl is available for Excel tests
-try:
-    import openpyxl  # noqa: F401
-
-    HAS_OPENPYXL = True
-except ImportError:
-    HAS_OPENPYXL = False
+# Check if openpyxl is available for Excel tests without importing it
+HAS_OPENPYXL = importlib.util.find_spec("openpyxl") is not None
 
 
 class TestGetClient:
@@ -40,166 +35,123 @@ class TestGetClient:
         client = _get_client(api_key="test-key", model="anthropic/claude-3-opus")
         assert client.model == "anthropic/claude-3-opus"
 
-
-class TestToSummarizedCsv:
-    """Tests for to_summarized_csv function."""
-
-    def test_csv_export_without_prompt(self):
-        """Test CSV export without AI summarization."""
-        df = pd.DataFrame({"name": ["Alice", "Bob"], "age": [25, 30]})
-
-        with tempfile.NamedTemporaryFile(suffix=".csv", delete=False, mode="w") as tmp:
-            tmp_path = tmp.name
-
-        try:
-            to_summarized_csv(df, tmp_path, index=False)
-
-            # Verify file was created and contains data
-            assert Path(tmp_path).exists()
-            result_df = pd.read_csv(tmp_path)
-            assert len(result_df) == 2
-            assert list(result_df.columns) == ["name", "age"]
-        finally:
-            if Path(tmp_path).exists():
-                os.unlink(tmp_path)
-
-    def test_csv_export_with_prompt(self):
-        """Test CSV export with prompt (currently shows warning)."""
-        df = pd.DataFrame({"name": ["Alice", "Bob"], "age": [25, 30]})
-
-        with tempfile.NamedTemporaryFile(suffix=".csv", delete=False, mode="w") as tmp:
-            tmp_path = tmp.name
-
-        try:
-            # Should warn about unimplemented feature
-            with pytest.warns(FutureWarning, match="not yet implemented"):
-                to_summarized_csv(
-                    df,
-                    tmp_path,
-                    prompt="Summarize by category",
-                    api_key="test-key",
-                    index=False,
-                )
-
-            # Verify file was created (with original data)
-            assert Path(tmp_path).exists()
-        finally:
-            if Path(tmp_path).exists():
-                os.unlink(tmp_path)
-
-
-class TestToSummarizedExcel:
-    """Tests for to_summarized_excel function."""
-
-    @pytest.mark.skipif(not HAS_OPENPYXL, reason="openpyxl not installed")
-    def test_excel_export_without_prompt(self):
-        """Test Excel export without AI summarization."""
-        df = pd.DataFrame({"product": ["A", "B"], "sales": [100, 200]})
-
-        with tempfile.NamedTemporaryFile(suffix=".xlsx", delete=False) as tmp:
-            tmp_path = tmp.name
-
-        try:
-            to_summarized_excel(df, tmp_path, index=False)
-
-            # Verify file was created
-            assert Path(tmp_path).exists()
-
-            # Verify contents
-            result_df = pd.read_excel(tmp_path)
-            assert len(result_df) == 2
-            assert list(result_df.columns) == ["product", "sales"]
-        finally:
-            if Path(tmp_path).exists():
-                os.unlink(tmp_path)
-
-    @pytest.mark.skipif(not HAS_OPENPYXL, reason="openpyxl not installed")
-    def test_excel_export_with_prompt(self):
-        """Test Excel export with prompt shows warning (AI not yet implemented)."""
-        df = pd.DataFrame({"product": ["A", "B"], "sales": [100, 200]})
-
-        with tempfile.NamedTemporaryFile(suffix=".xlsx", delete=False) as tmp:
-            tmp_path = tmp.name
-
-        try:
-            # Should show warning since AI transformation not yet implemented
-            with pytest.warns(
-                FutureWarning, match="AI-powered transformation is not yet implemented"
-            ):
-                to_summarized_excel(
-                    df,
-                    tmp_path,
-                    prompt="Add totals row",
-                    api_key="test-key",
-                    index=False,
-                )
-
-            # Verify file was created despite warning
-            assert Path(tmp_path).exists()
-
-            # Verify the original data was saved
-            result_df = pd.read_excel(tmp_path)
-            assert len(result_df) == 2
-            assert list(result_df.columns) == ["product", "sales"]
-        finally:
-            if Path(tmp_path).exists():
-                os.unlink(tmp_path)
-
-
-class TestToSummarizedJson:
-    """Tests for to_summarized_json function."""
-
-    def test_json_export_without_prompt(self):
-        """Test JSON export without AI summarization."""
-        df = pd.DataFrame({"id": [1, 2], "value": [100, 200]})
-
-        with tempfile.NamedTemporaryFile(suffix=".json", delete=False, mode="w") as tmp:
-            tmp_path = tmp.name
-
-        try:
-            to_summarized_json(df, tmp_path, orient="records")
-
-            # Verify file was created
-            assert Path(tmp_path).exists()
-
-            # Verify contents
-            result_df = pd.read_json(tmp_path, orient="records")
-            assert len(result_df) == 2
-            assert list(result_df.columns) == ["id", "value"]
-        finally:
-            if Path(tmp_path).exists():
-                os.unlink(tmp_path)
-
-    def test_json_export_with_prompt(self):
-        """Test JSON export with prompt (currently shows warning)."""
-        df = pd.DataFrame({"id": [1, 2], "value": [100, 200]})
-
-        with tempfile.NamedTemporaryFile(suffix=".json", delete=False, mode="w") as tmp:
-            tmp_path = tmp.name
-
-        try:
-            # Should warn about unimplemented feature
-            with pytest.warns(FutureWarning, match="not yet implemented"):
-                to_summarized_json(
-                    df, tmp_path, prompt="Nest by category", api_key="test-key"
-                )
-
-            # Verify file was created (with original data)
-            assert Path(tmp_path).exists()
-        finally:
-            if Path(tmp_path).exists():
-                os.unlink(tmp_path)
+    def test_get_client_memoized(self):
+        """Test that the same key and model reuse one client."""
+        client1 = _get_client(api_key="memo-key")
+        client2 = _get_client(api_key="memo-key")
+        assert client1 is client2
+        assert _get_client(api_key="other-key") is not client1
+
+    @patch.dict("os.environ", {"OPENROUTER_API_KEY": "env-key-1"})
+    def test_get_client_follows_env_key(self):
+        """Test that the environment key is resolved before the cache lookup."""
+        client1 = _get_client()
+        with patch.dict("os.environ", {"OPENROUTER_API_KEY": "env-key-2"}):
+            client2 = _get_client()
+        assert client1.api_key == "env-key-1"
+        assert client2.api_key == "env-key-2"
+
+
+@pytest.fixture(scope="module")
+def df_people():
+    """Small frame shared by the export tests; exporters only read it."""
+    return pd.DataFrame({"name": ["Alice", "Bob"], "age": [25, 30]})
+
+
+@pytest.fixture(scope="module")
+def df_sales():
+    """Sales-by-region frame for the summarization tests."""
+    return pd.DataFrame({"sales": [100, 200, 150], "region": ["A", "B", "A"]})
+
+
+@pytest.fixture(scope="module")
+def df_numbers():
+    """Single-column numeric frame."""
+    return pd.DataFrame({"data": [1, 2, 3]})
+
+
+def _csv_shape(path):
+    """Return (columns, row count) of a written CSV file."""
+    lines = path.read_text().splitlines()
+    return lines[0].split(","), len(lines) - 1
+
+
+def _excel_shape(path):
+    """Return (columns, row count) of a written Excel file."""
+    result_df = pd.read_excel(path)
+    return list(result_df.columns), len(result_df)
+
+
+def _json_shape(path):
+    """Return (columns, row count) of a file written with orient="records"."""
+    records = json.loads(path.read_text())
+    return list(records[0]), len(records)
+
+
+# (exporter, file suffix, export kwargs, shape of the written file)
+EXPORTERS = [
+    pytest.param(to_summarized_csv, ".csv", {"index": False}, _csv_shape, id="csv"),
+    pytest.param(
+        to_summarized_excel,
+        ".xlsx",
+        {"index": False},
+        _excel_shape,
+        id="excel",
+        marks=pytest.mark.skipif(not HAS_OPENPYXL, reason="openpyxl not installed"),
+    ),
+    pytest.param(
+        to_summarized_json, ".json", {"orient": "records"}, _json_shape, id="json"
+    ),
+]
+
+
+class TestSummarizedExport:
+    """Tests for the to_summarized_csv/excel/json functions."""
+
+    @pytest.mark.parametrize("exporter, suffix, kwargs, shape", EXPORTERS)
+    def test_export_without_prompt(
+        self, tmp_path, df_people, exporter, suffix, kwargs, shape
+    ):
+        """Test export without AI summarization."""
+        output = tmp_path / f"output{suffix}"
+
+        exporter(df_people, output, **kwargs)
+
+        # Verify file was created and contains data
+        assert output.exists()
+        assert shape(output) == (["name", "age"], 2)
+
+    @pytest.mark.parametrize("exporter, suffix, kwargs, shape", EXPORTERS)
+    def test_export_with_prompt(
+        self, tmp_path, df_people, exporter, suffix, kwargs, shape
+    ):
+        """Test export with prompt warns and writes the data as-is."""
+        output = tmp_path / f"output{suffix}"
+
+        # Should warn since AI transformation is not yet implemented
+        with pytest.warns(
+            FutureWarning, match="AI-powered transformation is not yet implemented"
+        ):
+            exporter(
+                df_people,
+                output,
+                prompt="Summarize by category",
+                api_key="test-key",
+                **kwargs,
+            )
+
+        # Verify the original data was saved
+        assert shape(output) == (["name", "age"], 2)
 
 
 class TestSummarizeDataframe:
     """Tests for summarize_dataframe function."""
 
     @patch("fundas.exporters._get_client")
-    def test_summarize_dataframe_success(self, mock_get_client):
+    def test_summarize_dataframe_success(self, mock_get_client, df_sales):
         """Test successful DataFrame summarization."""
-        df = pd.DataFrame({"sales": [100, 200, 150], "region": ["A", "B", "A"]})
 
-        mock_client = Mock()
+        mock_client = NonCallableMock(spec_set=OpenRouterClient)
         mock_response = {
             "choices": [
                 {
@@ -213,7 +165,7 @@ class TestSummarizeDataframe:
         mock_get_client.return_value = mock_client
 
         summary = summarize_dataframe(
-            df, prompt="Summarize by region", api_key="test-key"
+            df_sales, prompt="Summarize by region", api_key="test-key"
         )
 
         assert "Region A" in summary
@@ -221,15 +173,14 @@ class TestSummarizeDataframe:
         mock_client.process_content.assert_called_once()
 
     @patch("fundas.exporters._get_client")
-    def test_summarize_dataframe_no_response(self, mock_get_client):
+    def test_summarize_dataframe_no_response(self, mock_get_client, df_numbers):
         """Test DataFrame summarization with no API response."""
-        df = pd.DataFrame({"data": [1, 2, 3]})
 
-        mock_client = Mock()
+        mock_client = NonCallableMock(spec_set=OpenRouterClient)
         mock_response = {}  # Empty response
         mock_client.process_content.return_value = mock_response
         mock_get_client.return_value = mock_client
 
-        summary = summarize_dataframe(df, api_key="test-key")
+        summary = summarize_dataframe(df_numbers, api_key="test-key")
 
         assert summary == "Unable to generate summary"
@@ -0,0 +1,27 @@
+"""
+Tests for fundas.http module.
+"""
+
+from fundas.core import OpenRouterClient
+from fundas.http import get_shared_session
+
+
+class TestSharedSession:
+    """Tests for get_shared_session function."""
+
+    def test_shared_session_singleton(self):
+        """Test that get_shared_session returns a singleton instance."""
+        session1 = get_shared_session()
+        session2 = get_shared_session()
+        assert session1 is session2
+
+    def test_shared_session_pool_size(self):
+        """Test that the shared session is mounted with a large pool."""
+        adapter = get_shared_session().get_adapter("https://openrouter.ai")
+        assert adapter._pool_maxsize == 128
+
+    def test_client_uses_shared_session(self):
+        """Test that OpenRouterClient instances share one session."""
+        client1 = OpenRouterClient(api_key="test-key", use_cache=False)
+        client2 = OpenRouterClient(api_key="test-key", use_cache=False)
+        assert client1.session is client2.session is get_shared_session()
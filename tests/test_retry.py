@@ -0,0 +1,61 @@
+"""
+Tests for fundas.retry module.
+"""
+
+import pytest
+from unittest.mock import Mock, patch
+
+from fundas.retry import with_retry
+
+
+class TestWithRetry:
+    """Tests for with_retry decorator."""
+
+    @patch("fundas.retry.time.sleep")
+    def test_retries_until_success(self, mock_sleep):
+        """Test that failures are retried with linear backoff."""
+        func = Mock(side_effect=[ValueError("a"), ValueError("b"), "ok"])
+        wrapped = with_retry(max_retries=3, retry_delay=0.5)(func)
+
+        assert wrapped() == "ok"
+        assert func.call_count == 3
+        assert [c[0][0] for c in mock_sleep.call_args_list] == [0.5, 1.0]
+
+    @patch("fundas.retry.time.sleep")
+    def test_raises_after_last_attempt(self, mock_sleep):
+        """Test that the last error is raised once attempts run out."""
+        func = Mock(side_effect=ValueError("boom"))
+        wrapped = with_retry(max_retries=2, retry_delay=1)(func)
+
+        with pytest.raises(ValueError, match="boom"):
+            wrapped()
+        assert func.call_count == 2
+        assert mock_sleep.call_count == 1
+
+    @patch("fundas.retry.time.sleep")
+    def test_no_retry_exceptions_raise_immediately(self, mock_sleep):
+        """Test that no_retry exceptions are not retried."""
+        func = Mock(side_effect=KeyError("fatal"))
+        wrapped = with_retry(max_retries=3, retry_delay=1, no_retry=(KeyError,))(func)
+
+        with pytest.raises(KeyError):
+            wrapped()
+        assert func.call_count == 1
+        mock_sleep.assert_not_called()
+
+    def test_unlisted_exceptions_are_not_retried(self):
+        """Test that exceptions outside the retry list propagate."""
+        func = Mock(side_effect=TypeError("bad"))
+        wrapped = with_retry(max_retries=3, retry_delay=1, exceptions=(ValueError,))(
+            func
+        )
+
+        with pytest.raises(TypeError):
+            wrapped()
+        assert func.call_count == 1
+
+    def test_zero_retries_makes_one_attempt(self):
+        """Test that at least one attempt is always made."""
+        func = Mock(return_value="ok")
+        assert with_retry(max_retries=0, retry_delay=1)(func)() == "ok"
+        assert func.call_count == 1